@@ -6,9 +6,18 @@ and exports them into CSV files.
 """
 
 import csv
+import io
 import json
+import os
+import pickle
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import cache
+from operator import itemgetter
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 from xknxproject.models import KNXProject
 from xknxproject import XKNXProj
@@ -17,36 +26,201 @@ from xknxproject import XKNXProj
 PROJECT_FILE = "sample.knxproj"
 PROJECT_PASSWORD = ""  # optional
 PROJECT_LANGUAGE = "de-DE"  # optional
+FILE_PROJECT_CACHE = PROJECT_FILE + ".pkl"
 FILE_JSON = "project.json"
+JSON_PRETTY = False  # optional, indent the JSON dump for readability
 FILE_DEVICES = "devices.csv"
 FILE_GROUP_ADDRESSES = "group_addresses.csv"
 FILE_GROUP_ADDRESSES_ETS = "group_addresses_ets.csv"
+FILE_EXPORT_STAMP = "export_stamp.json"
+FORCE_EXPORT = False  # optional, rewrite output files even if they are up to date
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Location context of a device: (Building, Floor, Room, DistributionBoard)
+DeviceContext = Tuple[str, str, str, str]
+
+# Context used for devices that are not assigned to any location
+EMPTY_CTX: DeviceContext = ("", "", "", "")
+
+# Device fields exported to the devices CSV, in column order
+DEVICE_FIELDS = (
+    "individual_address",
+    "description",
+    "manufacturer_name",
+    "name",
+    "hardware_name",
+    "order_number",
+)
+_DEV_GETTER = itemgetter(*DEVICE_FIELDS)
+
+# Group address collected from the group ranges: (address parts, address, name, DPT)
+CollectedGroupAddress = Tuple[List[str], str, str, Optional[Dict[str, Any]]]
+
+# Group address entry: (sort key, address, name, depth, DPT)
+GroupAddressEntry = Tuple[Any, str, str, int, Optional[Dict[str, Any]]]
+
+# Position of each location type within a DeviceContext
+_CTX_INDEX = {"Building": 0, "Floor": 1, "Room": 2, "DistributionBoard": 3}
+
+
+def export_stamp() -> Dict[str, Any]:
+    """
+    Describe the inputs and settings the output files are generated from.
+
+    Returns:
+        A dictionary with the project file path, its modification time and size,
+        PROJECT_LANGUAGE and JSON_PRETTY.
+    """
+    stat = os.stat(PROJECT_FILE)
+    return {
+        "project_file": os.path.abspath(PROJECT_FILE),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "language": PROJECT_LANGUAGE,
+        "json_pretty": JSON_PRETTY,
+    }
+
+
+def read_export_stamp() -> Optional[Dict[str, Any]]:
+    """
+    Read the stamp written after the last successful export.
+
+    Returns:
+        The stored stamp, or None if it is missing or unreadable.
+    """
+    try:
+        with open(FILE_EXPORT_STAMP, encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def write_export_stamp(stamp: Dict[str, Any]) -> None:
+    """
+    Record the inputs and settings of a successful export.
+
+    Args:
+        stamp: The stamp taken before the export started.
+    """
+    with atomic_open(FILE_EXPORT_STAMP, "w", encoding="utf-8") as fp:
+        json.dump(stamp, fp)
+
+
+def is_up_to_date(path: str) -> bool:
+    """
+    Check whether an output file was generated from the current project and settings.
+
+    Args:
+        path: The path of the output file.
+
+    Returns:
+        True if the file exists, the export stamp matches the current project file,
+        PROJECT_LANGUAGE and JSON_PRETTY exactly and FORCE_EXPORT is not set.
+    """
+    if FORCE_EXPORT or not os.path.exists(path):
+        return False
+    return read_export_stamp() == export_stamp()
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "w", **kwargs: Any) -> Iterator[IO[Any]]:
+    """
+    Open a temporary file next to path and move it onto path once writing succeeded.
+
+    A failed or interrupted write never leaves a partial file under the final
+    name.
+
+    Args:
+        path: The path of the output file.
+        mode: The file mode, as for open().
+        **kwargs: Further arguments passed to open().
+
+    Yields:
+        The opened temporary file.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as fp:
+            yield fp
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def _project_file_signature() -> Tuple[int, int]:
+    """
+    Identify the current state of the KNX project file.
+
+    Returns:
+        The modification time in nanoseconds and the size of the project file.
+    """
+    stat = os.stat(PROJECT_FILE)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached_project() -> Optional[KNXProject]:
+    """
+    Load the parsed project from the pickle cache.
+
+    Returns:
+        The cached KNX project, or None if the cache is missing, unreadable or was
+        created for another state of the project file or another PROJECT_LANGUAGE.
+    """
+    try:
+        with open(FILE_PROJECT_CACHE, "rb") as fp:
+            cache_key, project = pickle.load(fp)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    if cache_key != (PROJECT_LANGUAGE, _project_file_signature()):
+        return None
+    return project
 
 
 def load_project() -> KNXProject:
     """
     Load and parse the KNX project.
 
+    Parsing is the most expensive step, so the parsed project is cached in a
+    pickle file together with the language and the project file's modification
+    time and size, and reused only while all of them match exactly.
+
     Returns:
         The parsed KNX project.
     """
+    if (project := _load_cached_project()) is not None:
+        return project
+
+    cache_key = (PROJECT_LANGUAGE, _project_file_signature())
     knxproj = XKNXProj(
         path=PROJECT_FILE,
         password=PROJECT_PASSWORD,
         language=PROJECT_LANGUAGE,
     )
-    return knxproj.parse()
+    project = knxproj.parse()
+    with atomic_open(FILE_PROJECT_CACHE, "wb") as fp:
+        pickle.dump((cache_key, project), fp, protocol=5)
+    return project
 
 
 def dump_project_json(project: KNXProject) -> None:
     """
-    Dump the complete project to a JSON file.
+    Dump the complete project to a JSON file, unless it is already up to date.
 
     Args:
         project: The KNX project data.
     """
-    with open(FILE_JSON, "w", encoding="utf-8") as fp:
-        json.dump(project, fp, indent=4)
+    if is_up_to_date(FILE_JSON):
+        return
+    with atomic_open(
+        FILE_JSON, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as fp:
+        if JSON_PRETTY:
+            json.dump(project, fp, indent=4, ensure_ascii=False)
+        else:
+            # json.dumps (unlike json.dump) serializes in one shot with the C encoder
+            fp.write(json.dumps(project, separators=(",", ":"), ensure_ascii=False))
 
 
 def format_last_modified(date_str: str) -> str:
@@ -64,250 +238,322 @@ def format_last_modified(date_str: str) -> str:
 
 
 def extract_device_data(
-    location: Dict[str, Any],
-    building: Optional[str] = None,
-    floor: Optional[str] = None,
-    room: Optional[str] = None,
-    distribution_board: Optional[str] = None,
-) -> Dict[str, Dict[str, Optional[str]]]:
-    """
-    Recursively extract device data along with their context 
+    root: Dict[str, Any], out: Dict[str, DeviceContext]
+) -> None:
+    """
+    Extract device data along with their context
     (Building, Floor, Room, DistributionBoard).
 
-    Args:
-        location: The current location dictionary.
-        building: The building name (if available).
-        floor: The floor name (if available).
-        room: The room name (if available).
-        distribution_board: The distribution board name (if available).
+    The location tree is walked iteratively with an explicit stack, writing
+    every device straight into the shared output dictionary. Location names
+    are interned, as the same names repeat across many devices and locations.
 
-    Returns:
-        A dictionary mapping device individual addresses to their context.
-    """
-    device_info: Dict[str, Dict[str, Optional[str]]] = {}
-    location_type = location.get("type")
-    if location_type == "Building":
-        building = location.get("name")
-    elif location_type == "Floor":
-        floor = location.get("name")
-    elif location_type == "Room":
-        room = location.get("name")
-    elif location_type == "DistributionBoard":
-        distribution_board = location.get("name")
-
-    # Collect devices from the current location
-    for device in location.get("devices", []):
-        device_info[device] = {
-            "Building": building,
-            "Floor": floor,
-            "Room": room,
-            "DistributionBoard": distribution_board,
-        }
-
-    # Recursively process subspaces
-    for subspace in location.get("spaces", {}).values():
-        device_info.update(
-            extract_device_data(subspace, building, floor, room, distribution_board)
-        )
-    return device_info
+    Args:
+        root: The top-level location dictionary.
+        out: A dictionary mapping device individual addresses to their context,
+            filled in place.
+    """
+    stack = deque([(root, EMPTY_CTX)])
+    while stack:
+        location, context = stack.pop()
+        devices = location["devices"]
+        spaces = location["spaces"]
+        # Empty leaves (e.g. rooms without devices) contribute nothing
+        if not devices and not spaces:
+            continue
+
+        idx = _CTX_INDEX.get(location["type"])
+        if idx is not None:
+            ctx = list(context)
+            ctx[idx] = sys.intern(location["name"])
+            context = tuple(ctx)
+
+        # Collect devices from the current location
+        if devices:
+            for device in devices:
+                out[device] = context
+
+        # Queue subspaces, reversed so they are visited in their original order
+        if spaces:
+            stack.extend((subspace, context) for subspace in reversed(spaces.values()))
 
 
 def export_devices_csv(
-    project: KNXProject, all_devices: Dict[str, Dict[str, Optional[str]]]
+    project: KNXProject, all_devices: Dict[str, DeviceContext]
 ) -> None:
     """
-    Export device data to a CSV file.
+    Export device data to a CSV file, unless it is already up to date.
 
     Args:
         project: The KNX project data.
         all_devices: A dictionary mapping device addresses to their context.
     """
-    fieldnames = [
-        "individual_address",
-        "description",
-        "manufacturer_name",
-        "name",
-        "hardware_name",
-        "order_number",
-        "building",
-        "floor",
-        "room",
-        "distribution_board",
-    ]
-    with open(FILE_DEVICES, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
+    if is_up_to_date(FILE_DEVICES):
+        return
+    devices = project["devices"]
+    fieldnames = [*DEVICE_FIELDS, "building", "floor", "room", "distribution_board"]
+    with atomic_open(
+        FILE_DEVICES,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=WRITE_BUFFER_SIZE,
+    ) as csvfile:
+        writer = csv.writer(
             csvfile,
-            fieldnames=fieldnames,
             delimiter=";",
             quotechar='"',
             quoting=csv.QUOTE_MINIMAL,
         )
-        writer.writeheader()
-        for device_addr, dev_data in project.get("devices", {}).items():
-            context = all_devices.get(dev_data.get("individual_address"), {})
-            writer.writerow(
-                {
-                    "individual_address": dev_data.get("individual_address"),
-                    "description": dev_data.get("description"),
-                    "manufacturer_name": dev_data.get("manufacturer_name"),
-                    "name": dev_data.get("name"),
-                    "hardware_name": dev_data.get("hardware_name"),
-                    "order_number": dev_data.get("order_number"),
-                    "building": context.get("Building", ""),
-                    "floor": context.get("Floor", ""),
-                    "room": context.get("Room", ""),
-                    "distribution_board": context.get("DistributionBoard", ""),
-                }
-            )
+        writer.writerow(fieldnames)
+        get_context = all_devices.get
+        writer.writerows(
+            _DEV_GETTER(dev_data) + get_context(device, EMPTY_CTX)
+            for device, dev_data in devices.items()
+        )
 
 
-def extract_group_ranges_dict(
-    group_range: Dict[str, Any], project: Dict[str, Any]
-) -> Dict[str, str]:
+def _walk_group_ranges(
+    group_range: Dict[str, Any],
+    group_addresses: Dict[str, Any],
+    out: List[CollectedGroupAddress],
+) -> None:
     """
-    Recursively extract the hierarchy of group addresses and return it as a sorted dictionary.
+    Recursively collect group ranges and group addresses into a single list.
 
     Args:
         group_range: The current group range dictionary.
-        project: The complete project dictionary.
-
-    Returns:
-        A sorted dictionary mapping group addresses to their names.
+        group_addresses: The group addresses of the project.
+        out: A list of (address parts, address, name, DPT) tuples, filled in place.
     """
-    hierarchy: Dict[str, str] = {}
     for address, details in group_range.items():
         full_address = address.strip("/")
-        hierarchy[full_address] = details.get("name", "Unknown")
+        name = details["name"]
+        out.append((full_address.split("/"), full_address, name, None))
 
-        # Add individual group addresses
-        for group_address in details.get("group_addresses", []):
-            group_data = project.get("group_addresses", {}).get(group_address, {})
-            hierarchy[group_address] = group_data.get("name", "Unknown")
+        # Add individual group addresses, keeping the DPT of three-level addresses
+        for group_address in details["group_addresses"]:
+            group_data = group_addresses[group_address]
+            parts = group_address.split("/")
+            dpt_info = group_data["dpt"] if len(parts) == 3 else None
+            name = group_data["name"]
+            out.append((parts, group_address, name, dpt_info))
 
         # Recursively process nested group ranges
-        hierarchy.update(
-            extract_group_ranges_dict(details.get("group_ranges", {}), project)
-        )
+        _walk_group_ranges(details["group_ranges"], group_addresses, out)
+
+
+def extract_group_address_entries(
+    group_range: Dict[str, Any], project: Dict[str, Any]
+) -> List[GroupAddressEntry]:
+    """
+    Extract the hierarchy of group addresses and return it as a sorted list.
+
+    Args:
+        group_range: The top-level group range dictionary.
+        project: The complete project dictionary.
+
+    Returns:
+        A sorted list of (sort key, address, name, depth, DPT) tuples. The depth is
+        0 for main groups, 1 for middle groups and 2 for group addresses; the DPT
+        is only set for typed three-level group addresses.
+    """
+    collected: List[CollectedGroupAddress] = []
+    _walk_group_ranges(group_range, project["group_addresses"], collected)
 
     # Sort the hierarchy based on numeric values (fallback to lexicographical sort)
     try:
-        sorted_hierarchy = dict(
-            sorted(
-                hierarchy.items(), key=lambda item: [int(x) for x in item[0].split("/")]
-            )
-        )
+        entries: List[GroupAddressEntry] = [
+            (tuple(map(int, parts)), address, name, len(parts) - 1, dpt_info)
+            for parts, address, name, dpt_info in collected
+        ]
     except ValueError:
-        sorted_hierarchy = dict(sorted(hierarchy.items()))
-    return sorted_hierarchy
+        entries = [
+            (address, address, name, len(parts) - 1, dpt_info)
+            for parts, address, name, dpt_info in collected
+        ]
+    entries.sort(key=itemgetter(0))
+    return entries
 
 
-def export_group_addresses_csv(
-    project: Dict[str, Any], hierarchy_dict: Dict[str, str]
-) -> None:
+@cache
+def _dpt_string(main: int, sub: int) -> str:
     """
-    Export group addresses to a CSV file.
+    Format a datapoint type as "main.sub" (e.g. "9.0001").
+
+    KNX projects reuse a handful of DPTs for thousands of group addresses,
+    so the formatted strings are memoized.
 
     Args:
-        project: The complete project dictionary.
-        hierarchy_dict: A dictionary mapping group addresses to their names.
+        main: The main number of the DPT.
+        sub: The sub number of the DPT.
+
+    Returns:
+        The formatted DPT.
     """
-    fieldnames = ["address", "name", "dpt"]
-    with open(FILE_GROUP_ADDRESSES, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=fieldnames,
-            delimiter=";",
-            quotechar='"',
-            quoting=csv.QUOTE_MINIMAL,
-        )
-        writer.writeheader()
-        for address, name in hierarchy_dict.items():
-            dpt = ""
-            if address.count("/") == 2:
-                group_addr_data = project.get("group_addresses", {}).get(address, {})
-                dpt_info = group_addr_data.get("dpt")
-                if dpt_info:
-                    dpt = f"{dpt_info.get('main')}.{dpt_info.get('sub'):04}"
-            writer.writerow({"address": address, "name": name, "dpt": dpt})
-
-
-def export_group_addresses_ets_csv(
-    project: Dict[str, Any], hierarchy_dict: Dict[str, str]
-) -> None:
+    return "%d.%04d" % (main, sub)
+
+
+@cache
+def _dpst_string(main: int, sub: int) -> str:
     """
-    Export group addresses to a CSV file for ETS import.
+    Format a datapoint type as used by ETS (e.g. "DPST-9-1").
 
     Args:
-        project: The complete project dictionary.
-        hierarchy_dict: A dictionary mapping group addresses to their names.
-    """
-    fieldnames = [
-        "Main",
-        "Middle",
-        "Sub",
-        "Address",
-        "Central",
-        "Unfiltered",
-        "Description",
-        "DatapointType",
-        "Security",
-    ]
-    with open(FILE_GROUP_ADDRESSES_ETS, "w", newline="", encoding="cp1252") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=fieldnames,
+        main: The main number of the DPT.
+        sub: The sub number of the DPT.
+
+    Returns:
+        The formatted DPT.
+    """
+    return "DPST-%s-%s" % (main, sub)
+
+
+def _ets_row(
+    address: str, name: str, depth: int, dpt_info: Optional[Dict[str, Any]]
+) -> Tuple[str, ...]:
+    """
+    Build a single row of the ETS group address import file.
+
+    Args:
+        address: The group address (or group range address).
+        name: The name of the group address.
+        depth: The number of slashes in the address.
+        dpt_info: The datapoint type of the group address, if any.
+
+    Returns:
+        A tuple in the order of the ETS CSV field names.
+    """
+    if depth == 0:
+        return (name, "", "", f"{address}/-/-", "", "", "", "", "Auto")
+    if depth == 1:
+        return ("", name, "", f"{address}/-", "", "", "", "", "Auto")
+    if depth == 2:
+        dpst = _dpst_string(dpt_info["main"], dpt_info["sub"]) if dpt_info else ""
+        return ("", "", name, address, "", "", "", dpst, "Auto")
+    return ("", "", "", address, "", "", "", "", "Auto")
+
+
+def export_group_addresses_csvs(entries: List[GroupAddressEntry]) -> None:
+    """
+    Export group addresses to a CSV file and to a CSV file for ETS import,
+    skipping files that are already up to date.
+
+    Both files are produced from a single pass over the group addresses.
+
+    Args:
+        entries: The sorted group address entries.
+    """
+    write_plain = not is_up_to_date(FILE_GROUP_ADDRESSES)
+    write_ets = not is_up_to_date(FILE_GROUP_ADDRESSES_ETS)
+    if not write_plain and not write_ets:
+        return
+
+    # Only build the rows of files that are written, so an up-to-date file
+    # cannot make the export of the other one fail
+    plain_rows: List[Tuple[str, str, str]] = []
+    ets_rows: List[Tuple[str, ...]] = []
+    for _, address, name, depth, dpt_info in entries:
+        if write_plain:
+            dpt = _dpt_string(dpt_info["main"], dpt_info["sub"]) if dpt_info else ""
+            plain_rows.append((address, name, dpt))
+        if write_ets:
+            ets_rows.append(_ets_row(address, name, depth, dpt_info))
+
+    if write_plain:
+        with atomic_open(
+            FILE_GROUP_ADDRESSES,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(
+                csvfile,
+                delimiter=";",
+                quotechar='"',
+                quoting=csv.QUOTE_MINIMAL,
+            )
+            writer.writerow(["address", "name", "dpt"])
+            writer.writerows(plain_rows)
+
+    if write_ets:
+        fieldnames = [
+            "Main",
+            "Middle",
+            "Sub",
+            "Address",
+            "Central",
+            "Unfiltered",
+            "Description",
+            "DatapointType",
+            "Security",
+        ]
+        # Render the whole file in memory and encode it in one go; group address
+        # lists are small enough, and this avoids encoding every row separately
+        ets_file = io.StringIO(newline="")
+        writer = csv.writer(
+            ets_file,
             delimiter=";",
             quotechar='"',
             quoting=csv.QUOTE_ALL,
         )
-        writer.writeheader()
-        for address, name in hierarchy_dict.items():
-            row: Dict[str, Any] = {"Address": address, "Security": "Auto"}
-            if address.count("/") == 0:
-                row["Main"] = name
-                row["Address"] = f"{address}/-/-"
-            elif address.count("/") == 1:
-                row["Middle"] = name
-                row["Address"] = f"{address}/-"
-            elif address.count("/") == 2:
-                row["Sub"] = name
-                group_addr_data = project.get("group_addresses", {}).get(address, {})
-                dpt_info = group_addr_data.get("dpt")
-                if dpt_info:
-                    row["DatapointType"] = (
-                        f"DPST-{dpt_info.get('main')}-{dpt_info.get('sub')}"
-                    )
-                else:
-                    row["DatapointType"] = ""
-            writer.writerow(row)
+        writer.writerow(fieldnames)
+        writer.writerows(ets_rows)
+        # Encode before opening the file, so a name cp1252 cannot represent
+        # does not leave a truncated file behind
+        data = ets_file.getvalue().encode("cp1252")
+        with atomic_open(FILE_GROUP_ADDRESSES_ETS, "wb") as fp:
+            fp.write(data)
 
 
 def main() -> None:
     """
     Main function to load the project, export JSON, extract and export devices and group addresses.
     """
+    # Outputs of another project or other settings are rewritten below. Drop the
+    # old stamp first, so an interrupted run cannot leave them marked as current.
+    stamp = export_stamp()
+    if read_export_stamp() != stamp:
+        with suppress(FileNotFoundError):
+            os.remove(FILE_EXPORT_STAMP)
+
     # Load the project and create a JSON dump
     project = load_project()
     dump_project_json(project)
 
-    info = project.get("info", {})
-    print("Project Name:", info.get("name", "Unknown"))
-    if last_modified := info.get("last_modified"):
+    info = project["info"]
+    print("Project Name:", info["name"])
+    if last_modified := info["last_modified"]:
         print("Last Modified:", format_last_modified(last_modified))
-    print("Tool Version:", info.get("tool_version", ""))
-    print("XKNXProject Version:", info.get("xknxproject_version", ""))
-
-    # Extract device data from locations
-    all_devices: Dict[str, Dict[str, Optional[str]]] = {}
-    for building_data in project.get("locations", {}).values():
-        all_devices.update(extract_device_data(building_data))
-    export_devices_csv(project, all_devices)
-
-    # Process and export group addresses
-    group_ranges = project.get("group_ranges", {})
-    hierarchy_dict = extract_group_ranges_dict(group_ranges, project)
-    export_group_addresses_csv(project, hierarchy_dict)
-    export_group_addresses_ets_csv(project, hierarchy_dict)
+    print("Tool Version:", info["tool_version"])
+    print("XKNXProject Version:", info["xknxproject_version"])
+
+    # Extract device data from locations. Seeding the dictionary with every known
+    # device sizes it once up front instead of growing (and rehashing) it while
+    # walking the locations; devices without a location keep EMPTY_CTX.
+    # This stage is dict and string shuffling, so a JIT like numba would not help
+    # here: it cannot compile code working on arbitrary Python dicts and strings.
+    all_devices: Dict[str, DeviceContext] = dict.fromkeys(
+        project["devices"], EMPTY_CTX
+    )
+    for building_data in project["locations"].values():
+        extract_device_data(building_data, all_devices)
+
+    # Process group addresses
+    group_ranges = project["group_ranges"]
+    group_address_entries = extract_group_address_entries(group_ranges, project)
+
+    # The CSV files are independent of each other, so write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(export_devices_csv, project, all_devices),
+            executor.submit(export_group_addresses_csvs, group_address_entries),
+        ]
+        for future in futures:
+            future.result()
+
+    write_export_stamp(stamp)
 
 
 if __name__ == "__main__":